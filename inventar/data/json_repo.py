@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from .models import Item
 from .repository import AbstractRepository, RepositoryError
@@ -263,13 +263,17 @@ class JSONRepository(AbstractRepository):
         def list_custom_values(self, category: str) -> List[str]:
                 return list(self.custom_values.get(category, []))
 
+        def list_custom_values_bulk(self, categories: Iterable[str]) -> Dict[str, List[str]]:
+                return {category: list(self.custom_values.get(category, [])) for category in categories}
+
         def add_custom_value(self, category: str, value: str) -> None:
                 normalized = self._normalize_values(self.custom_values.get(category, []) + [value])
                 self.custom_values[category] = normalized
                 self._save()
 
         def remove_custom_value(self, category: str, value: str) -> None:
-                values = [entry for entry in self.custom_values.get(category, []) if entry.lower() != value.lower()]
+                value_lower = value.lower()
+                values = [entry for entry in self.custom_values.get(category, []) if entry.lower() != value_lower]
                 if values:
                         self.custom_values[category] = self._normalize_values(values)
                 elif category in self.custom_values:
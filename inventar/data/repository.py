@@ -3,7 +3,7 @@ from __future__ import annotations
 import abc
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from .models import Item
 
@@ -85,6 +85,14 @@ class AbstractRepository(abc.ABC):
         def list_custom_values(self, category: str) -> List[str]:
                 """Liefert gespeicherte Zusatzwerte für Auswahlfelder."""
 
+        def list_custom_values_bulk(self, categories: Iterable[str]) -> Dict[str, List[str]]:
+                """Liefert die Zusatzwerte mehrerer Kategorien, je Kategorie.
+
+                Standardmäßig einzeln über list_custom_values(); Backends können das mit einem Zugriff erledigen.
+                """
+
+                return {category: self.list_custom_values(category) for category in categories}
+
         @abc.abstractmethod
         def add_custom_value(self, category: str, value: str) -> None:
                 """Speichert einen neuen Zusatzwert für Auswahlfelder."""
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sqlite3
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from .models import Item
 from .repository import AbstractRepository, RepositoryError
@@ -29,6 +29,13 @@ CREATE TABLE IF NOT EXISTS custom_values (
 );
 """
 
+# Entspricht der Sortierung von list(), damit SQLite ohne temporären Sortierbaum ausliefert.
+# Wird erst nach der Migration angelegt, da diese die Tabelle neu aufbaut.
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_items_objekttyp_modell
+        ON items(objekttyp COLLATE NOCASE, modell COLLATE NOCASE);
+"""
+
 
 class SQLiteRepository(AbstractRepository):
         """SQLite-Implementation der Repository-Schnittstelle."""
@@ -45,6 +52,7 @@ class SQLiteRepository(AbstractRepository):
                 self.connection.executescript(SCHEMA)
                 self._migrate_schema()
                 self.connection.executescript(SCHEMA)
+                self.connection.executescript(INDEXES)
                 self.connection.commit()
 
         @staticmethod
@@ -334,6 +342,22 @@ class SQLiteRepository(AbstractRepository):
                 ).fetchall()
                 return [row[0] for row in rows if row[0]]
 
+        def list_custom_values_bulk(self, categories: Iterable[str]) -> Dict[str, List[str]]:
+                conn = self._ensure_conn()
+                categories = list(categories)
+                values: Dict[str, List[str]] = {category: [] for category in categories}
+                if not categories:
+                        return values
+                placeholders = ', '.join('?' for _ in categories)
+                rows = conn.execute(
+                        f"SELECT category, value FROM custom_values WHERE category IN ({placeholders}) ORDER BY value COLLATE NOCASE",
+                        categories,
+                ).fetchall()
+                for category, value in rows:
+                        if value:
+                                values[category].append(value)
+                return values
+
         def add_custom_value(self, category: str, value: str) -> None:
                 conn = self._ensure_conn()
                 cleaned = value.strip()
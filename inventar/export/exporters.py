@@ -3,9 +3,9 @@ from __future__ import annotations
 import csv
 import json
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable
 
-import pandas as pd
+from openpyxl import Workbook
 
 from inventar.data.models import Item
 
@@ -25,28 +25,35 @@ class ExportError(RuntimeError):
 	"""Fehler beim Exportieren der Daten."""
 
 
-def items_to_dicts(items: Iterable[Item]) -> List[dict]:
-	return [item.to_dict() for item in items]
-
-
 def export_to_csv(items: Iterable[Item], path: Path) -> Path:
-	rows = items_to_dicts(items)
 	with Path(path).open('w', encoding='utf-8', newline='') as fh:
-		writer = csv.DictWriter(fh, fieldnames=COLUMNS)
-		writer.writeheader()
-		for row in rows:
-			writer.writerow({key: row.get(key, '') for key in COLUMNS})
+		writer = csv.writer(fh)
+		writer.writerow(COLUMNS)
+		# Zeilen direkt aus den Items schreiben, ohne Zwischenliste von Dicts.
+		writer.writerows([getattr(item, key) for key in COLUMNS] for item in items)
 	return Path(path)
 
 
 def export_to_json(items: Iterable[Item], path: Path) -> Path:
 	with Path(path).open('w', encoding='utf-8') as fh:
-		json.dump(items_to_dicts(items), fh, ensure_ascii=False, indent=2)
+		# Einträge einzeln schreiben statt erst alle Dicts zu sammeln; Ausgabe wie json.dump(..., indent=2).
+		separator = '\n'
+		fh.write('[')
+		for item in items:
+			fh.write(separator)
+			fh.write('  ' + json.dumps(item.to_dict(), ensure_ascii=False, indent=2).replace('\n', '\n  '))
+			separator = ',\n'
+		fh.write(']' if separator == '\n' else '\n]')
 	return Path(path)
 
 
 def export_to_xlsx(items: Iterable[Item], path: Path) -> Path:
-	df = pd.DataFrame(items_to_dicts(items), columns=COLUMNS)
-	with pd.ExcelWriter(Path(path), engine='openpyxl') as writer:
-		df.to_excel(writer, index=False, sheet_name='Inventar')
-	return Path(path)
+	path = Path(path)
+	# Write-only-Modus schreibt die Zeilen direkt, statt die Mappe im Speicher aufzubauen (mit lxml am schnellsten).
+	workbook = Workbook(write_only=True)
+	sheet = workbook.create_sheet('Inventar')
+	sheet.append(COLUMNS)
+	for item in items:
+		sheet.append([getattr(item, key) for key in COLUMNS])
+	workbook.save(path)
+	return path
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import Optional
-
-from PySide6.QtCore import QDate, Qt
-from PySide6.QtGui import QKeySequence
+import contextlib
+import functools
+import re
+from datetime import date
+from typing import Iterable, Optional
+
+from PySide6.QtCore import QDate, QSignalBlocker, QStringListModel
+from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import (
         QComboBox,
         QDateEdit,
@@ -12,6 +16,7 @@ from PySide6.QtWidgets import (
         QGridLayout,
         QLabel,
         QLineEdit,
+        QMessageBox,
         QPlainTextEdit,
         QPushButton,
         QSizePolicy,
@@ -22,6 +27,120 @@ from PySide6.QtWidgets import (
 from inventar.data.models import Item
 from inventar.utils.validators import DATE_FORMAT_QT_DISPLAY, ItemValidator
 
+# Wird einmal pro Dialog gesetzt; beim Umschalten ändert sich nur die Property ``stillgelegt``.
+# Eine QPalette reicht nicht, da das Stylesheet des Hauptfensters Hintergrundfarben überschreibt.
+ITEM_DIALOG_STYLESHEET = (
+        'QPlainTextEdit#anmerkungen { background-color: white; }\n'
+        'QPushButton[stillgelegt="true"] { background-color: #c62828; color: white; }'
+)
+# Zeilen, die nur aus dem Stilllegungs-Hinweis bestehen (inkl. Zeilenumbruch).
+_STILLGELEGT_LINE_RE = re.compile(r'^[ \t]*stillgelegt[ \t]*(?:\n|$)', re.IGNORECASE | re.MULTILINE)
+# Mindestbreite der Auswahlfelder in Zeichen, statt sie aus allen Einträgen zu messen.
+COMBO_MIN_CONTENTS_LENGTH = 20
+# Qt-Format für die Speicherung als ISO-Datum.
+_ISO_FMT = 'yyyy-MM-dd'
+
+
+def _qdate_from_iso(value: str) -> QDate:
+        """Wandelt ein ISO-Datum ohne Formatstring-Auswertung in ein QDate um."""
+
+        try:
+                parsed = date.fromisoformat(value)
+        except ValueError:
+                return QDate()
+        return QDate(parsed.year, parsed.month, parsed.day)
+
+
+def _date_value(editor: QDateEdit, display_format: bool) -> str | None:
+        text = editor.text().strip()
+        if not text:
+                return '' if display_format else None
+        return text if display_format else editor.date().toString(_ISO_FMT)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_sorted(values: tuple[str, ...]) -> tuple[str, ...]:
+        """Sortiert Auswahllisten einmal und teilt das Ergebnis zwischen Dialogen."""
+
+        return tuple(sorted(values))
+
+
+# Aktuelles Modell je Katalog, geteilt bei gleichen Werten: (Werte, Modell, Zeile je Text).
+_SHARED_MODELS: dict[str, tuple[tuple[str, ...], QStringListModel, dict[str, int]]] = {}
+
+
+def _shared_model(key: str, values: tuple[str, ...]) -> tuple[QStringListModel, dict[str, int]]:
+        """Liefert das gemeinsame Modell eines Katalogs für genau diese Werte.
+
+        Ein Modell wird nach dem Anlegen nie verändert; andere Werte bekommen ein neues
+        Modell, damit bereits geöffnete Dialoge ihre Liste und Zeilenzuordnung behalten.
+        """
+
+        entry = _SHARED_MODELS.get(key)
+        if entry is not None and (entry[0] is values or entry[0] == values):
+                return entry[1], entry[2]
+        # Wie findText(): exakter Vergleich, bei Duplikaten zählt der erste Eintrag.
+        row_of = {value: row for row, value in reversed(tuple(enumerate(values)))}
+        model = QStringListModel(list(values))
+        _SHARED_MODELS[key] = (values, model, row_of)
+        return model, row_of
+
+
+class LazyComboBox(QComboBox):
+        """Editierbare ComboBox, die ihre Einträge erst bei Bedarf lädt.
+
+        Bis zum ersten Aufklappen oder Fokussieren zeigt sie nur den
+        aktuellen Text an, sodass der Dialog unabhängig von der Listenlänge
+        geöffnet wird.
+        """
+
+        def __init__(self, catalog: str, values: Iterable[str] = (), parent: QWidget | None = None) -> None:
+                super().__init__(parent)
+                self.setEditable(True)
+                # Das Modell wird geteilt; freie Eingaben bleiben im Textfeld dieses Dialogs.
+                self.setInsertPolicy(QComboBox.NoInsert)
+                self._catalog = catalog
+                self.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+                self.setMinimumContentsLength(COMBO_MIN_CONTENTS_LENGTH)
+                self._values = tuple(values)
+                self._loaded = False
+                self._row_of: dict[str, int] = {}
+                # Hält das Modell am Leben, auch wenn der Cache inzwischen ein neueres führt.
+                self._list_model: QStringListModel | None = None
+                if self._values:
+                        # Entspricht der Vorauswahl des ersten Eintrags einer befüllten ComboBox.
+                        self.setEditText(self._values[0])
+
+        def ensure_loaded(self) -> None:
+                if self._loaded:
+                        return
+                self._loaded = True
+                text = self.currentText()
+                model, self._row_of = _shared_model(self._catalog, self._values)
+                self._list_model = model
+                with QSignalBlocker(self):
+                        self.setModel(model)
+                        index = self.row_of(text)
+                        if index >= 0:
+                                self.setCurrentIndex(index)
+                        else:
+                                self.setEditText(text)
+                self._values = ()
+
+        def row_of(self, text: str) -> int:
+                """Liefert die Zeile eines Eintrags oder -1, ohne das Modell zu durchsuchen."""
+
+                return self._row_of.get(text, -1)
+
+        def showPopup(self) -> None:  # type: ignore[override]
+                self.ensure_loaded()
+                super().showPopup()
+
+        def focusInEvent(self, event) -> None:  # type: ignore[override]
+                # Beim Tippen soll die Autovervollständigung bereits alle Werte kennen.
+                self.ensure_loaded()
+                super().focusInEvent(event)
+
 
 class ItemDialog(QDialog):
         """Dialog zum Erstellen/Bearbeiten von Items."""
@@ -30,6 +149,20 @@ class ItemDialog(QDialog):
         ACTION_CANCEL = 'cancel'
         ACTION_DELETE = 'delete'
 
+        # Wird beim ersten Dialog erzeugt, da Standard-Tastenkürzel eine laufende QApplication benötigen.
+        _SHORTCUT_SAVE: QKeySequence | None = None
+
+        # (Beschriftung, Widget-Attribut, Zeile, Spalte, Spaltenbreite des Widgets)
+        _FORM_ROWS = (
+                ('Objekttyp', 'objekttyp_combo', 0, 0, 1),
+                ('Hersteller', 'hersteller_combo', 1, 0, 1),
+                ('Modell', 'modell_combo', 2, 0, 1),
+                ('Seriennummer', 'seriennummer_edit', 0, 2, 1),
+                ('Einkaufsdatum', 'einkaufsdatum_edit', 1, 2, 1),
+                ('Zuweisungsdatum', 'zuweisungsdatum_edit', 2, 2, 1),
+                ('Aktueller Besitzer', 'aktueller_besitzer_combo', 3, 0, 3),
+        )
+
         def __init__(
                 self,
                 parent: QWidget | None = None,
@@ -49,6 +182,7 @@ class ItemDialog(QDialog):
                 self._result_action = ItemDialog.ACTION_CANCEL
                 self._stillgelegt_value = bool(item.stillgelegt) if item else False
                 self._deactivate_button: QPushButton | None = None
+                self._error_box: QMessageBox | None = None
                 self._build_ui()
                 if item:
                         self._populate(item)
@@ -58,24 +192,13 @@ class ItemDialog(QDialog):
                         self.zuweisungsdatum_edit.setDate(today)
 
         def _build_ui(self) -> None:
+                self.setStyleSheet(ITEM_DIALOG_STYLESHEET)
                 layout = QVBoxLayout(self)
 
                 form_layout = QGridLayout()
-                self.objekttyp_combo = QComboBox()
-                self.objekttyp_combo.setEditable(True)
-                if self.object_types:
-                        self.objekttyp_combo.addItems(self.object_types)
-                self.hersteller_combo = QComboBox()
-                self.hersteller_combo.setEditable(True)
-                if self.manufacturers:
-                        self.hersteller_combo.addItems(sorted(self.manufacturers))
-                self.modell_combo = QComboBox()
-                self.modell_combo.setEditable(True)
-                if self.models:
-                        self.modell_combo.addItems(sorted(self.models))
-
-                for combo in (self.objekttyp_combo, self.hersteller_combo, self.modell_combo):
-                        combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+                self.objekttyp_combo = LazyComboBox('objekttyp', self.object_types)
+                self.hersteller_combo = LazyComboBox('hersteller', _cached_sorted(tuple(self.manufacturers)))
+                self.modell_combo = LazyComboBox('modell', _cached_sorted(tuple(self.models)))
 
                 self.seriennummer_edit = QLineEdit()
                 self.einkaufsdatum_edit = QDateEdit()
@@ -86,28 +209,21 @@ class ItemDialog(QDialog):
                 self.zuweisungsdatum_edit = QDateEdit()
                 self.zuweisungsdatum_edit.setDisplayFormat(DATE_FORMAT_QT_DISPLAY)
                 self.zuweisungsdatum_edit.setCalendarPopup(True)
-                self.aktueller_besitzer_combo = QComboBox()
-                self.aktueller_besitzer_combo.setEditable(True)
-                self.aktueller_besitzer_combo.addItems(sorted(self.owners))
-                self.aktueller_besitzer_combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+                self.aktueller_besitzer_combo = LazyComboBox('aktueller_besitzer', _cached_sorted(tuple(self.owners)))
+                combo_policy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+                for combo in (
+                        self.objekttyp_combo,
+                        self.hersteller_combo,
+                        self.modell_combo,
+                        self.aktueller_besitzer_combo,
+                ):
+                        combo.setSizePolicy(combo_policy)
                 self.anmerkungen_edit = QPlainTextEdit()
-                self.anmerkungen_edit.setStyleSheet('background-color: white;')
-
-                form_layout.addWidget(QLabel('Objekttyp'), 0, 0)
-                form_layout.addWidget(self.objekttyp_combo, 0, 1)
-                form_layout.addWidget(QLabel('Hersteller'), 1, 0)
-                form_layout.addWidget(self.hersteller_combo, 1, 1)
-                form_layout.addWidget(QLabel('Modell'), 2, 0)
-                form_layout.addWidget(self.modell_combo, 2, 1)
-
-                form_layout.addWidget(QLabel('Seriennummer'), 0, 2)
-                form_layout.addWidget(self.seriennummer_edit, 0, 3)
-                form_layout.addWidget(QLabel('Einkaufsdatum'), 1, 2)
-                form_layout.addWidget(self.einkaufsdatum_edit, 1, 3)
-                form_layout.addWidget(QLabel('Zuweisungsdatum'), 2, 2)
-                form_layout.addWidget(self.zuweisungsdatum_edit, 2, 3)
-                form_layout.addWidget(QLabel('Aktueller Besitzer'), 3, 0)
-                form_layout.addWidget(self.aktueller_besitzer_combo, 3, 1, 1, 3)
+                self.anmerkungen_edit.setObjectName('anmerkungen')
+
+                for label, attr, row, column, span in self._FORM_ROWS:
+                        form_layout.addWidget(QLabel(label), row, column)
+                        form_layout.addWidget(getattr(self, attr), row, column + 1, 1, span)
 
                 layout.addLayout(form_layout)
                 layout.addWidget(QLabel('Anmerkungen'))
@@ -133,48 +249,44 @@ class ItemDialog(QDialog):
                         delete_button.clicked.connect(self._handle_delete_clicked)
                 layout.addWidget(self.button_box)
 
-                self.shortcut_save = QKeySequence(Qt.CTRL | Qt.Key_S)
-                self.grabShortcut(self.shortcut_save)
+                if ItemDialog._SHORTCUT_SAVE is None:
+                        ItemDialog._SHORTCUT_SAVE = QKeySequence(QKeySequence.Save)
+                self.shortcut_save = QShortcut(ItemDialog._SHORTCUT_SAVE, self)
+                self.shortcut_save.activated.connect(self._handle_save_clicked)
 
         def _populate(self, item: Item) -> None:
-                if item.objekttyp:
-                        index = self.objekttyp_combo.findText(item.objekttyp)
-                        if index >= 0:
-                                self.objekttyp_combo.setCurrentIndex(index)
-                        else:
+                # Während des Befüllens sollen keine Änderungssignale ausgelöst werden.
+                widgets = (
+                        self.objekttyp_combo,
+                        self.hersteller_combo,
+                        self.modell_combo,
+                        self.seriennummer_edit,
+                        self.einkaufsdatum_edit,
+                        self.zuweisungsdatum_edit,
+                        self.aktueller_besitzer_combo,
+                        self.anmerkungen_edit,
+                )
+                with contextlib.ExitStack() as blockers:
+                        for widget in widgets:
+                                blockers.enter_context(QSignalBlocker(widget))
+                        # Die Listenauswahl wird beim ersten Laden der ComboBox nachgezogen.
+                        if item.objekttyp:
                                 self.objekttyp_combo.setEditText(item.objekttyp)
-                if item.hersteller:
-                        index = self.hersteller_combo.findText(item.hersteller)
-                        if index >= 0:
-                                self.hersteller_combo.setCurrentIndex(index)
-                        else:
-                                self.hersteller_combo.setEditText(item.hersteller)
-                else:
-                        self.hersteller_combo.setCurrentText('')
-                if item.modell:
-                        index = self.modell_combo.findText(item.modell)
-                        if index >= 0:
-                                self.modell_combo.setCurrentIndex(index)
-                        else:
-                                self.modell_combo.setEditText(item.modell)
-                else:
-                        self.modell_combo.setCurrentText('')
-                self.seriennummer_edit.setText(item.seriennummer or '')
-                if item.einkaufsdatum:
-                        qdate = QDate.fromString(item.einkaufsdatum, 'yyyy-MM-dd')
-                        if qdate.isValid():
-                                self.einkaufsdatum_edit.setDate(qdate)
-                if item.zuweisungsdatum:
-                        assign_date = QDate.fromString(item.zuweisungsdatum, 'yyyy-MM-dd')
-                        if assign_date.isValid():
-                                self.zuweisungsdatum_edit.setDate(assign_date)
-                owner_value = item.aktueller_besitzer or ''
-                index = self.aktueller_besitzer_combo.findText(owner_value)
-                if index >= 0:
-                        self.aktueller_besitzer_combo.setCurrentIndex(index)
-                else:
-                        self.aktueller_besitzer_combo.setEditText(owner_value)
-                self.anmerkungen_edit.setPlainText(item.anmerkungen or '')
+                        self.hersteller_combo.setEditText(item.hersteller or '')
+                        self.modell_combo.setEditText(item.modell or '')
+                        if item.seriennummer:
+                                self.seriennummer_edit.setText(item.seriennummer)
+                        if item.einkaufsdatum:
+                                qdate = _qdate_from_iso(item.einkaufsdatum)
+                                if qdate.isValid():
+                                        self.einkaufsdatum_edit.setDate(qdate)
+                        if item.zuweisungsdatum:
+                                assign_date = _qdate_from_iso(item.zuweisungsdatum)
+                                if assign_date.isValid():
+                                        self.zuweisungsdatum_edit.setDate(assign_date)
+                        self.aktueller_besitzer_combo.setEditText(item.aktueller_besitzer or '')
+                        if item.anmerkungen:
+                                self.anmerkungen_edit.setPlainText(item.anmerkungen)
 
         def accept(self) -> None:  # type: ignore[override]
                 valid, errors = ItemValidator.validate(self._collect_data(display_format=True))
@@ -184,35 +296,43 @@ class ItemDialog(QDialog):
                 super().accept()
 
         def _collect_data(self, display_format: bool = False) -> dict:
-                def _text_value(value: str) -> str | None:
-                        text = value.strip()
-                        if display_format:
-                                return text
-                        return text or None
-
-                def _date_value(widget: QDateEdit) -> str | None:
-                        text = widget.text().strip()
-                        if not text:
-                                return '' if display_format else None
-                        return text if display_format else widget.date().toString('yyyy-MM-dd')
+                objekttyp = self.objekttyp_combo.currentText().strip()
+                hersteller = self.hersteller_combo.currentText().strip()
+                modell = self.modell_combo.currentText().strip()
+                seriennummer = self.seriennummer_edit.text().strip()
+                aktueller_besitzer = self.aktueller_besitzer_combo.currentText().strip()
+                anmerkungen = self.anmerkungen_edit.toPlainText().strip()
+                if not display_format:
+                        # Leere Eingaben werden als None gespeichert.
+                        objekttyp = objekttyp or None
+                        hersteller = hersteller or None
+                        modell = modell or None
+                        seriennummer = seriennummer or None
+                        aktueller_besitzer = aktueller_besitzer or None
+                        anmerkungen = anmerkungen or None
 
                 return {
-                        'objekttyp': _text_value(self.objekttyp_combo.currentText()),
-                        'hersteller': _text_value(self.hersteller_combo.currentText()),
-                        'modell': _text_value(self.modell_combo.currentText()),
-                        'seriennummer': _text_value(self.seriennummer_edit.text()),
-                        'einkaufsdatum': _date_value(self.einkaufsdatum_edit),
-                        'zuweisungsdatum': _date_value(self.zuweisungsdatum_edit),
-                        'aktueller_besitzer': _text_value(self.aktueller_besitzer_combo.currentText()),
-                        'anmerkungen': _text_value(self.anmerkungen_edit.toPlainText()),
+                        'objekttyp': objekttyp,
+                        'hersteller': hersteller,
+                        'modell': modell,
+                        'seriennummer': seriennummer,
+                        'einkaufsdatum': _date_value(self.einkaufsdatum_edit, display_format),
+                        'zuweisungsdatum': _date_value(self.zuweisungsdatum_edit, display_format),
+                        'aktueller_besitzer': aktueller_besitzer,
+                        'anmerkungen': anmerkungen,
                         'stillgelegt': self._stillgelegt_value,
                 }
 
         def _show_errors(self, errors: dict) -> None:
                 messages = '\n'.join(f"{field}: {message}" for field, message in errors.items())
-                from PySide6.QtWidgets import QMessageBox
-
-                QMessageBox.warning(self, 'Eingabe ungültig', messages)
+                if self._error_box is None:
+                        # Die Meldung wird bei jedem ungültigen Speichern wiederverwendet.
+                        self._error_box = QMessageBox(self)
+                        self._error_box.setIcon(QMessageBox.Warning)
+                        self._error_box.setWindowTitle('Eingabe ungültig')
+                        self._error_box.setStandardButtons(QMessageBox.Ok)
+                self._error_box.setText(messages)
+                self._error_box.exec()
 
         def get_item_data(self) -> dict:
                 return self._collect_data()
@@ -252,18 +372,21 @@ class ItemDialog(QDialog):
         def _update_deactivate_button(self) -> None:
                 if not self._deactivate_button:
                         return
-                if self._stillgelegt_value:
-                        self._deactivate_button.setText('Stilllegen: AN')
-                        self._deactivate_button.setStyleSheet('background-color: #c62828; color: white;')
-                else:
-                        self._deactivate_button.setText('Stilllegen: AUS')
-                        self._deactivate_button.setStyleSheet('')
+                button = self._deactivate_button
+                button.setText('Stilllegen: AN' if self._stillgelegt_value else 'Stilllegen: AUS')
+                if button.property('stillgelegt') == self._stillgelegt_value:
+                        return
+                button.setProperty('stillgelegt', self._stillgelegt_value)
+                # Property-Selektoren werden erst nach erneutem Polieren ausgewertet.
+                button.style().unpolish(button)
+                button.style().polish(button)
 
         def _remove_stillgelegt_note(self) -> None:
                 text = self.anmerkungen_edit.toPlainText()
                 if not text:
                         return
-                lines = text.splitlines()
-                filtered_lines = [line for line in lines if line.strip().lower() != 'stillgelegt']
-                new_text = '\n'.join(filtered_lines).rstrip()
-                self.anmerkungen_edit.setPlainText(new_text)
+                new_text = _STILLGELEGT_LINE_RE.sub('', text).rstrip()
+                if new_text == text:
+                        return
+                with QSignalBlocker(self.anmerkungen_edit):
+                        self.anmerkungen_edit.setPlainText(new_text)
@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+import bisect
+import functools
+import operator
+import re
+import string
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List, Optional
-
-from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QDate, QEvent, QTimer
-from PySide6.QtGui import QAction, QIcon, QKeySequence, QColor, QFont
+from typing import Callable, Iterable, List, Optional
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QDate,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    QSize,
+    QStringListModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QAction, QIcon, QKeySequence, QColor
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -25,6 +44,8 @@ from PySide6.QtWidgets import (
     QPushButton,
     QSizePolicy,
     QStatusBar,
+    QStyle,
+    QStyleOptionComboBox,
     QTableView,
     QToolButton,
     QVBoxLayout,
@@ -206,6 +227,58 @@ CUSTOM_CATEGORY_MANUFACTURER = "manufacturer"
 CUSTOM_CATEGORY_MODEL = "model"
 CUSTOM_CATEGORY_SERIAL = "serial_number"
 CUSTOM_CATEGORY_OWNER = "owner"
+CUSTOM_CATEGORIES = (
+        CUSTOM_CATEGORY_MANUFACTURER,
+        CUSTOM_CATEGORY_MODEL,
+        CUSTOM_CATEGORY_SERIAL,
+        CUSTOM_CATEGORY_OWNER,
+)
+
+DATE_COLUMN_KEYS = {"einkaufsdatum", "zuweisungsdatum"}
+
+# Farben für stillgelegte Zeilen, einmalig erzeugt statt bei jedem Zeichnen.
+STILLGELEGT_FOREGROUND = QColor(Qt.red)
+STILLGELEGT_BACKGROUND = QColor(255, 205, 210)
+
+
+# Liest alle Spaltenwerte eines Items mit einem Aufruf.
+_COLUMN_GETTER = operator.attrgetter(*COLUMN_KEYS)
+_DATE_COLUMNS = tuple(column for column, key in enumerate(COLUMN_KEYS) if key in DATE_COLUMN_KEYS)
+# Grobe Vorprüfung für tt.mm.jjjj, damit halb getippte Daten nicht erst an strptime scheitern
+_DISPLAY_DATE_RE = re.compile(r'\d{1,2}\.\d{1,2}\.\d{4}')
+# Ab so vielen getrennten Zeilenbereichen ist ein Modell-Reset günstiger als einzelne Einfüge-/Löschsignale.
+_MAX_ROW_RUNS = 32
+# SQLite COLLATE NOCASE faltet nur A–Z; Umlaute behalten ihre Groß-/Kleinschreibung.
+_NOCASE_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_date(value: str) -> str:
+        """ISO-Datum im Anzeigeformat; dieselben Daten kommen in vielen Zeilen und nach jedem Filtern wieder."""
+
+        try:
+                return datetime.strptime(value, '%Y-%m-%d').strftime(DATE_FORMAT_DISPLAY)
+        except ValueError:
+                return value
+
+
+def _display_row(item: Item) -> tuple:
+        """Liefert die Anzeigewerte einer Tabellenzeile in Spaltenreihenfolge."""
+        row = list(_COLUMN_GETTER(item))
+        for column in _DATE_COLUMNS:
+                value = row[column]
+                if value:
+                        row[column] = _format_date(value)
+        return tuple(row)
+
+
+def _list_order_key(item: Item) -> tuple:
+        """Sortierschlüssel wie repository.list(): Objekttyp, Modell, bei Gleichstand die ID."""
+        return (
+                (item.objekttyp or '').translate(_NOCASE_TABLE),
+                (item.modell or '').translate(_NOCASE_TABLE),
+                item.id or 0,
+        )
 
 
 class ItemTableModel(QAbstractTableModel):
@@ -213,13 +286,80 @@ class ItemTableModel(QAbstractTableModel):
 
         def __init__(self, items: Optional[List[Item]] = None) -> None:
                 super().__init__()
-                self._items: List[Item] = items or []
+                self._items: List[Item] = list(items) if items else []
+                # Anzeigewerte je Zeile, werden beim ersten Zeichnen der Zeile berechnet.
+                self._display_rows: List[Optional[tuple]] = [None] * len(self._items)
 
         def set_items(self, items: List[Item]) -> None:
+                items = list(items)
+                # Unveränderte Listen (gleiche Objekte, gleiche Reihenfolge) lösen keinen Reset aus.
+                if len(items) == len(self._items) and all(new is old for new, old in zip(items, self._items)):
+                        return
+                # Eingrenzen oder Erweitern eines Filters meldet nur die betroffenen Zeilen,
+                # Auswahl und Scrollposition bleiben dadurch erhalten.
+                if len(items) < len(self._items):
+                        runs = self._missing_row_runs(self._items, items)
+                        if runs is not None:
+                                for first, last in reversed(runs):
+                                        self.beginRemoveRows(QModelIndex(), first, last)
+                                        del self._items[first:last + 1]
+                                        del self._display_rows[first:last + 1]
+                                        self.endRemoveRows()
+                                return
+                elif len(items) > len(self._items):
+                        runs = self._missing_row_runs(items, self._items)
+                        if runs is not None:
+                                for first, last in runs:
+                                        self.beginInsertRows(QModelIndex(), first, last)
+                                        self._items[first:first] = items[first:last + 1]
+                                        self._display_rows[first:first] = [None] * (last - first + 1)
+                                        self.endInsertRows()
+                                return
                 self.beginResetModel()
-                self._items = list(items)
+                self._items = items
+                self._display_rows = [None] * len(self._items)
                 self.endResetModel()
 
+        @staticmethod
+        def _missing_row_runs(longer: List[Item], shorter: List[Item]) -> Optional[List[tuple[int, int]]]:
+                """Zusammenhängende Zeilenbereiche aus longer, die in shorter fehlen.
+
+                Liefert None, wenn shorter keine Teilfolge von longer ist oder die Bereiche zu zahlreich sind.
+                """
+                runs: List[tuple[int, int]] = []
+                matched = 0
+                for row, item in enumerate(longer):
+                        if matched < len(shorter) and item is shorter[matched]:
+                                matched += 1
+                        elif runs and runs[-1][1] == row - 1:
+                                runs[-1] = (runs[-1][0], row)
+                        else:
+                                runs.append((row, row))
+                                if len(runs) > _MAX_ROW_RUNS:
+                                        return None
+                return runs if matched == len(shorter) else None
+
+        def update_item(self, row: int, item: Item) -> None:
+                self._items[row] = item
+                self._display_rows[row] = None
+                self.dataChanged.emit(
+                        self.index(row, 0),
+                        self.index(row, len(COLUMN_KEYS) - 1),
+                        [Qt.DisplayRole, Qt.ForegroundRole, Qt.BackgroundRole],
+                )
+
+        def remove_item(self, row: int) -> None:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._items[row]
+                del self._display_rows[row]
+                self.endRemoveRows()
+
+        def row_of(self, item: Item) -> Optional[int]:
+                for row, candidate in enumerate(self._items):
+                        if candidate is item:
+                                return row
+                return None
+
         def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
                 return 0 if parent.isValid() else len(self._items)
 
@@ -227,23 +367,49 @@ class ItemTableModel(QAbstractTableModel):
                 return 0 if parent.isValid() else len(COLUMN_KEYS)
 
         def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
-                if not index.isValid():
-                        return None
-                item = self._items[index.row()]
-                key = COLUMN_KEYS[index.column()]
-                value = getattr(item, key)
+                # Qt fragt viele Rollen ab; nur die unterstützten greifen auf das Item zu.
                 if role == Qt.DisplayRole:
-                        if key in {'einkaufsdatum', 'zuweisungsdatum'} and value:
-                                return datetime.strptime(value, '%Y-%m-%d').strftime(DATE_FORMAT_DISPLAY)
-                        return value
+                        if not index.isValid():
+                                return None
+                        row = index.row()
+                        display = self._display_rows[row]
+                        if display is None:
+                                display = self._display_rows[row] = _display_row(self._items[row])
+                        return display[index.column()]
+                if role == Qt.ForegroundRole:
+                        if index.isValid() and self._items[index.row()].stillgelegt:
+                                return STILLGELEGT_FOREGROUND
+                        return None
+                if role == Qt.BackgroundRole:
+                        if index.isValid() and self._items[index.row()].stillgelegt:
+                                return STILLGELEGT_BACKGROUND
+                        return None
                 if role == Qt.UserRole:
-                        return item
-                if role == Qt.ForegroundRole and getattr(item, 'stillgelegt', False):
-                        return QColor(Qt.red)
-                if role == Qt.BackgroundRole and getattr(item, 'stillgelegt', False):
-                        return QColor(255, 205, 210)
+                        return self._items[index.row()] if index.isValid() else None
                 return None
 
+        def multiData(self, index: QModelIndex, roleDataSpan) -> None:  # type: ignore[override]
+                # Der Delegate fragt alle Rollen einer Zelle gesammelt ab; ein Aufruf statt einem je Rolle.
+                if not index.isValid():
+                        return
+                row = index.row()
+                item = self._items[row]
+                for role_data in roleDataSpan:
+                        role = role_data.role()
+                        if role == Qt.DisplayRole:
+                                display = self._display_rows[row]
+                                if display is None:
+                                        display = self._display_rows[row] = _display_row(item)
+                                role_data.setData(display[index.column()])
+                        elif role == Qt.ForegroundRole and item.stillgelegt:
+                                role_data.setData(STILLGELEGT_FOREGROUND)
+                        elif role == Qt.BackgroundRole and item.stillgelegt:
+                                role_data.setData(STILLGELEGT_BACKGROUND)
+                        elif role == Qt.UserRole:
+                                role_data.setData(item)
+                        else:
+                                role_data.clearData()
+
         def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):  # type: ignore[override]
                 if role != Qt.DisplayRole:
                         return None
@@ -257,6 +423,32 @@ class ItemTableModel(QAbstractTableModel):
                 return None
 
 
+class ExportSignals(QObject):
+        """Signale eines ExportWorker, werden im GUI-Thread ausgeliefert."""
+
+        finished = Signal(str)
+        failed = Signal(str)
+
+
+class ExportWorker(QRunnable):
+        """Führt einen Export im Thread-Pool aus, damit die Oberfläche bedienbar bleibt."""
+
+        def __init__(self, exporter: Callable[[Iterable[Item], Path], Path], items: List[Item], path: Path) -> None:
+                super().__init__()
+                self.exporter = exporter
+                self.items = items
+                self.path = path
+                self.signals = ExportSignals()
+
+        def run(self) -> None:
+                try:
+                        self.exporter(self.items, self.path)
+                except Exception as e:
+                        self.signals.failed.emit(str(e))
+                        return
+                self.signals.finished.emit(str(self.path))
+
+
 class MainWindow(QMainWindow):
         """Hauptfenster der Inventarverwaltung."""
 
@@ -268,23 +460,25 @@ class MainWindow(QMainWindow):
                 self.settings = SettingsManager()
                 self.repository, self.using_json_fallback = create_repository(Path.cwd())
                 self.object_types: List[str] = self.settings.load_object_types()
-                self.custom_manufacturers: list[str] = self.repository.list_custom_values(
-                        CUSTOM_CATEGORY_MANUFACTURER
-                )
-                self.custom_models: list[str] = self.repository.list_custom_values(CUSTOM_CATEGORY_MODEL)
-                self.custom_serial_numbers: list[str] = self.repository.list_custom_values(CUSTOM_CATEGORY_SERIAL)
-                self.custom_owners: list[str] = self.repository.list_custom_values(CUSTOM_CATEGORY_OWNER)
+                # Die Zusatzwerte lädt _load_items() zusammen mit den Items.
+                self.custom_manufacturers: list[str] = []
+                self.custom_models: list[str] = []
+                self.custom_serial_numbers: list[str] = []
+                self.custom_owners: list[str] = []
                 self.table_model = ItemTableModel()
                 self.table = QTableView()
                 self.table.setModel(self.table_model)
                 self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
                 self.table.setSelectionMode(QAbstractItemView.SingleSelection)
                 self.table.doubleClicked.connect(self.edit_selected_item)
-                self.table.setSortingEnabled(True)
 
                 # RESPONSIVE DESIGN: Tabelle passt sich der Breite an
                 self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
                 self.table.horizontalHeader().setStretchLastSection(True)
+                # Feste Zeilenhöhe: Qt muss die Zeilen nicht einzeln vermessen.
+                self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+                # Bei fester Höhe passt ohnehin nur eine Zeile; Kürzen statt Umbrechen spart das Textlayout.
+                self.table.setWordWrap(False)
 
                 self.table.setAlternatingRowColors(True)
                 self.table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -295,24 +489,36 @@ class MainWindow(QMainWindow):
                 self._font_size = 10
                 self.items: List[Item] = []
                 self.filtered_items: List[Item] = []
+                # Kleingeschriebener Suchtext je Item, parallel zu self.items.
+                self._search_index: List[str] = []
+
+                self._export_worker: Optional[ExportWorker] = None
+                self._filter_widths_equalized = False
 
                 self._filter_timer = QTimer(self)
                 self._filter_timer.setSingleShot(True)
                 self._filter_timer.setInterval(250)
                 self._filter_timer.timeout.connect(self.apply_filters)
 
-                self._build_ui()
+                # Vor dem Aufbau setzen, damit die Widgets nur einmal poliert werden.
                 self._apply_color_palette()
+                self._build_ui()
                 self._create_actions()
                 self._connect_signals()
-                self._load_items()
                 self.settings.restore_geometry(self)
                 try:
                         self._font_size = self.settings.restore_table(self.table)
                 except Exception:
                         pass
-                self._update_status()
+                # Das Modell sortiert nicht selbst; ein aus älteren Einstellungen übernommener Sortierpfeil wäre irreführend.
+                self.table.horizontalHeader().setSortIndicatorShown(False)
 
+                # Daten erst nach dem ersten Zeichnen laden, damit das Fenster sofort erscheint.
+                self.statusBar().showMessage('Lade Inventar …')
+                QTimer.singleShot(0, self._initial_load)
+
+        def _initial_load(self) -> None:
+                self._load_items()
                 if self.using_json_fallback:
                         self.statusBar().showMessage('JSON-Fallback aktiv – SQLite nicht verfügbar', 10000)
 
@@ -387,31 +593,36 @@ class MainWindow(QMainWindow):
                 box.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
                 box.setStyleSheet('QGroupBox::title { color: black; font-weight: bold; }')
                 layout = QHBoxLayout(box)
+                # Die Werte aus Items und Zusatzwerten trägt erst _initial_load() ein.
 
                 left_layout = QFormLayout()
                 self.filter_objekttyp = QComboBox()
                 self.filter_objekttyp.setEditable(True)
                 self.filter_objekttyp.setInsertPolicy(QComboBox.NoInsert)
+                self.filter_objekttyp.setModel(QStringListModel(self.filter_objekttyp))
                 self.filter_objekttyp.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
                 self._update_object_type_filter()
 
                 self.filter_hersteller = QComboBox()
                 self.filter_hersteller.setEditable(True)
                 self.filter_hersteller.setInsertPolicy(QComboBox.NoInsert)
+                self.filter_hersteller.setModel(QStringListModel(self.filter_hersteller))
                 self.filter_hersteller.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                self._update_manufacturer_filter()
+                self._update_manufacturer_filter(())
 
                 self.filter_modell = QComboBox()
                 self.filter_modell.setEditable(True)
                 self.filter_modell.setInsertPolicy(QComboBox.NoInsert)
+                self.filter_modell.setModel(QStringListModel(self.filter_modell))
                 self.filter_modell.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                self._update_model_filter()
+                self._update_model_filter(())
 
                 self.filter_seriennummer = QComboBox()
                 self.filter_seriennummer.setEditable(True)
                 self.filter_seriennummer.setInsertPolicy(QComboBox.NoInsert)
+                self.filter_seriennummer.setModel(QStringListModel(self.filter_seriennummer))
                 self.filter_seriennummer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                self._update_serial_filter()
+                self._update_serial_filter(())
 
                 left_layout.addRow('Objekttyp', self.filter_objekttyp)
                 left_layout.addRow('Hersteller', self.filter_hersteller)
@@ -440,8 +651,9 @@ class MainWindow(QMainWindow):
                 self.filter_besitzer = QComboBox()
                 self.filter_besitzer.setEditable(True)
                 self.filter_besitzer.setInsertPolicy(QComboBox.NoInsert)
+                self.filter_besitzer.setModel(QStringListModel(self.filter_besitzer))
                 self.filter_besitzer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                self._update_owner_combo()
+                self._update_owner_combo(())
                 self.filter_anmerkungen = QLineEdit()
                 self.filter_anmerkungen.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
                 self.add_owner_button = QToolButton()
@@ -462,17 +674,21 @@ class MainWindow(QMainWindow):
                 right_layout.addRow('Aktueller Besitzer', owner_layout)
                 right_layout.addRow('Anmerkungen', self.filter_anmerkungen)
 
-                combo_boxes = [
+                # Einmal festgehaltene Filter-Widgets für reset_filters/_clear_date_filters
+                self._combo_filter_widgets = (
                         self.filter_objekttyp,
                         self.filter_hersteller,
                         self.filter_modell,
                         self.filter_seriennummer,
                         self.filter_besitzer,
-                ]
+                )
+                self._date_filter_widgets = (self.filter_einkaufsdatum, self.filter_zuweisungsdatum)
+                # lineEdit() bleibt für die Lebensdauer des QDateEdit gleich
+                self._date_filter_line_edits = tuple(
+                        (date_edit, date_edit.lineEdit()) for date_edit in self._date_filter_widgets if date_edit.lineEdit()
+                )
 
-                max_width = max(combo.sizeHint().width() for combo in combo_boxes)
-                for combo in combo_boxes:
-                        combo.setMinimumWidth(max_width)
+                for combo in self._combo_filter_widgets:
                         combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
                 layout.addLayout(left_layout)
@@ -568,21 +784,106 @@ class MainWindow(QMainWindow):
         # ---------- Daten laden & Status ----------
         def _load_items(self) -> None:
                 self.items = self.repository.list()
-                self.custom_manufacturers = self.repository.list_custom_values(CUSTOM_CATEGORY_MANUFACTURER)
-                self.custom_models = self.repository.list_custom_values(CUSTOM_CATEGORY_MODEL)
-                self.custom_serial_numbers = self.repository.list_custom_values(CUSTOM_CATEGORY_SERIAL)
-                self.custom_owners = self.repository.list_custom_values(CUSTOM_CATEGORY_OWNER)
+                self._search_index = [self._search_text(it) for it in self.items]
+                custom_values = self.repository.list_custom_values_bulk(CUSTOM_CATEGORIES)
+                self.custom_manufacturers = custom_values[CUSTOM_CATEGORY_MANUFACTURER]
+                self.custom_models = custom_values[CUSTOM_CATEGORY_MODEL]
+                self.custom_serial_numbers = custom_values[CUSTOM_CATEGORY_SERIAL]
+                self.custom_owners = custom_values[CUSTOM_CATEGORY_OWNER]
                 self.filtered_items = list(self.items)
                 self.table_model.set_items(self.filtered_items)
                 self._refresh_object_types()
-                self._update_object_type_filter()
-                self._update_manufacturer_filter()
-                self._update_model_filter()
-                self._update_serial_filter()
-                self._update_owner_combo()
+                self._refresh_filter_combos()
                 self._update_status()
                 self._update_item_action_visibility()
 
+        def _refresh_filter_combos(self) -> None:
+                values = self._distinct_item_values()
+                self._update_object_type_filter()
+                self._update_manufacturer_filter(values['hersteller'])
+                self._update_model_filter(values['modell'])
+                self._update_serial_filter(values['seriennummer'])
+                self._update_owner_combo(values['aktueller_besitzer'])
+                if not self._filter_widths_equalized:
+                        self._equalize_filter_widths()
+
+        def _equalize_filter_widths(self) -> None:
+                # Einheitliche Breite nach dem ersten Befüllen, vorher sind die Auswahllisten noch leer.
+                # Direkt gemessen, da sizeHint() die Größe der noch leeren Liste vom ersten Anzeigen behält.
+                max_width = max(self._combo_contents_width(combo) for combo in self._combo_filter_widgets)
+                for combo in self._combo_filter_widgets:
+                        combo.setMinimumWidth(max_width)
+                self._filter_widths_equalized = True
+
+        @staticmethod
+        def _combo_contents_width(combo: QComboBox) -> int:
+                """Breite des längsten Eintrags zuzüglich Rahmen und Pfeil laut Stil."""
+                metrics = combo.fontMetrics()
+                text_width = max((metrics.horizontalAdvance(combo.itemText(row)) for row in range(combo.count())), default=0)
+                option = QStyleOptionComboBox()
+                combo.initStyleOption(option)
+                size = QSize(text_width, metrics.height())
+                return combo.style().sizeFromContents(QStyle.CT_ComboBox, option, size, combo).width()
+
+        def _distinct_item_values(self) -> dict[str, set[str]]:
+                """Sammelt die vorhandenen Feldwerte in einem Durchlauf über die geladenen Items."""
+                object_types: set[str] = set()
+                manufacturers: set[str] = set()
+                models: set[str] = set()
+                serials: set[str] = set()
+                owners: set[str] = set()
+                for it in self.items:
+                        if it.objekttyp:
+                                object_types.add(it.objekttyp)
+                        if it.hersteller:
+                                manufacturers.add(it.hersteller)
+                        if it.modell:
+                                models.add(it.modell)
+                        if it.seriennummer:
+                                serials.add(it.seriennummer)
+                        if it.aktueller_besitzer:
+                                owners.add(it.aktueller_besitzer)
+                return {
+                        'objekttyp': object_types,
+                        'hersteller': manufacturers,
+                        'modell': models,
+                        'seriennummer': serials,
+                        'aktueller_besitzer': owners,
+                }
+
+        def _replace_item(self, old: Item, new: Item) -> None:
+                # Nur die betroffene Tabellenzeile wird neu gezeichnet, kein Reset des Modells.
+                self._search_index = [
+                        self._search_text(new) if it is old else text for it, text in zip(self.items, self._search_index)
+                ]
+                self.items = [new if it is old else it for it in self.items]
+                self.filtered_items = [new if it is old else it for it in self.filtered_items]
+                row = self.table_model.row_of(old)
+                if row is not None:
+                        self.table_model.update_item(row, new)
+
+        def _store_item(self, old: Optional[Item], new: Optional[Item]) -> None:
+                # Das vom Repository gelieferte Item wird einsortiert, statt die ganze Liste neu zu laden.
+                if not isinstance(new, Item) or new.id is None:
+                        self._load_items()
+                        return
+                if old is not None:
+                        self._drop_item(old)
+                keys = [_list_order_key(it) for it in self.items]
+                row = bisect.bisect_right(keys, _list_order_key(new))
+                self.items = self.items[:row] + [new] + self.items[row:]
+                self._search_index = self._search_index[:row] + [self._search_text(new)] + self._search_index[row:]
+                self._refresh_filter_combos()
+                self._update_item_action_visibility()
+
+        def _drop_item(self, old: Item) -> None:
+                self._search_index = [text for it, text in zip(self.items, self._search_index) if it is not old]
+                self.items = [it for it in self.items if it is not old]
+                self.filtered_items = [it for it in self.filtered_items if it is not old]
+                row = self.table_model.row_of(old)
+                if row is not None:
+                        self.table_model.remove_item(row)
+
         def _update_status(self) -> None:
                 total = len(self.items)
                 shown = len(self.filtered_items)
@@ -599,115 +900,77 @@ class MainWindow(QMainWindow):
 
         # ---------- Hilfen für Combos ----------
         def _merge_custom_values(self, base: Iterable[str], custom: Iterable[str]) -> List[str]:
-                merged = {v.strip() for v in base if v and str(v).strip()}
-                merged.update({v.strip() for v in custom if v and str(v).strip()})
+                # Ein Durchlauf, jeder Wert wird nur einmal getrimmt; reine Leerzeichen ergeben '' und fallen raus.
+                merged = {value.strip() for values in (base, custom) for value in values if value}
                 merged.discard('')
                 return sorted(merged, key=str.casefold)
 
+        @staticmethod
+        def _set_filter_values(combo: QComboBox, values: List[str]) -> None:
+                # Ein setStringList() ersetzt die Liste in einem Schritt statt Eintrag für Eintrag.
+                model = combo.model()
+                entries = [''] + values
+                if model.stringList() == entries:
+                        # Unveränderte Liste: kein Modell-Reset, Auswahl und Eingabe bleiben unberührt.
+                        return
+                current_text = combo.currentText().strip() if combo.count() else ''
+                with QSignalBlocker(combo):
+                        model.setStringList(entries)
+                        if current_text:
+                                combo.setCurrentText(current_text)
+                        else:
+                                combo.setCurrentIndex(0)
+
         def _refresh_object_types(self) -> None:
                 self.object_types = self.settings.load_object_types()
 
-        def _update_owner_combo(self) -> None:
+        def _update_owner_combo(self, values: Optional[Iterable[str]] = None) -> None:
                 if not hasattr(self, 'filter_besitzer'):
                         return
-                owners = self.repository.distinct_owners() if hasattr(self.repository, 'distinct_owners') else []
-                owners = self._merge_custom_values(owners, self.custom_owners)
-                current_text = self.filter_besitzer.currentText().strip() if self.filter_besitzer.count() else ''
-                self.filter_besitzer.blockSignals(True)
-                self.filter_besitzer.clear()
-                self.filter_besitzer.addItem('')
-                self.filter_besitzer.addItems(owners)
-                if current_text:
-                        self.filter_besitzer.setCurrentText(current_text)
-                else:
-                        self.filter_besitzer.setCurrentIndex(0)
-                self.filter_besitzer.blockSignals(False)
+                if values is None:
+                        values = self.repository.distinct_owners() if hasattr(self.repository, 'distinct_owners') else []
+                owners = self._merge_custom_values(values, self.custom_owners)
+                self._set_filter_values(self.filter_besitzer, owners)
 
-        def _update_manufacturer_filter(self) -> None:
+        def _update_manufacturer_filter(self, values: Optional[Iterable[str]] = None) -> None:
                 if not hasattr(self, 'filter_hersteller'):
                         return
-                manufacturers = self.repository.distinct_manufacturers() if hasattr(self.repository, 'distinct_manufacturers') else []
-                manufacturers = self._merge_custom_values(manufacturers, self.custom_manufacturers)
-                current_text = self.filter_hersteller.currentText().strip() if self.filter_hersteller.count() else ''
-                self.filter_hersteller.blockSignals(True)
-                self.filter_hersteller.clear()
-                self.filter_hersteller.addItem('')
-                self.filter_hersteller.addItems(manufacturers)
-                if current_text:
-                        self.filter_hersteller.setCurrentText(current_text)
-                else:
-                        self.filter_hersteller.setCurrentIndex(0)
-                self.filter_hersteller.blockSignals(False)
+                if values is None:
+                        values = self.repository.distinct_manufacturers() if hasattr(self.repository, 'distinct_manufacturers') else []
+                manufacturers = self._merge_custom_values(values, self.custom_manufacturers)
+                self._set_filter_values(self.filter_hersteller, manufacturers)
 
-        def _update_model_filter(self) -> None:
+        def _update_model_filter(self, values: Optional[Iterable[str]] = None) -> None:
                 if not hasattr(self, 'filter_modell'):
                         return
-                models = self.repository.distinct_models() if hasattr(self.repository, 'distinct_models') else []
-                models = self._merge_custom_values(models, self.custom_models)
-                current_text = self.filter_modell.currentText().strip() if self.filter_modell.count() else ''
-                self.filter_modell.blockSignals(True)
-                self.filter_modell.clear()
-                self.filter_modell.addItem('')
-                self.filter_modell.addItems(models)
-                if current_text:
-                        self.filter_modell.setCurrentText(current_text)
-                else:
-                        self.filter_modell.setCurrentIndex(0)
-                self.filter_modell.blockSignals(False)
+                if values is None:
+                        values = self.repository.distinct_models() if hasattr(self.repository, 'distinct_models') else []
+                models = self._merge_custom_values(values, self.custom_models)
+                self._set_filter_values(self.filter_modell, models)
 
-        def _update_serial_filter(self) -> None:
+        def _update_serial_filter(self, values: Optional[Iterable[str]] = None) -> None:
                 if not hasattr(self, 'filter_seriennummer'):
                         return
-                serials = self.repository.distinct_serial_numbers() if hasattr(self.repository, 'distinct_serial_numbers') else []
-                serials = self._merge_custom_values(serials, self.custom_serial_numbers)
-                current_text = self.filter_seriennummer.currentText().strip() if self.filter_seriennummer.count() else ''
-                self.filter_seriennummer.blockSignals(True)
-                self.filter_seriennummer.clear()
-                self.filter_seriennummer.addItem('')
-                self.filter_seriennummer.addItems(serials)
-                if current_text:
-                        self.filter_seriennummer.setCurrentText(current_text)
-                else:
-                        self.filter_seriennummer.setCurrentIndex(0)
-                self.filter_seriennummer.blockSignals(False)
+                if values is None:
+                        values = self.repository.distinct_serial_numbers() if hasattr(self.repository, 'distinct_serial_numbers') else []
+                serials = self._merge_custom_values(values, self.custom_serial_numbers)
+                self._set_filter_values(self.filter_seriennummer, serials)
 
         def _update_object_type_filter(self) -> None:
                 if not hasattr(self, 'filter_objekttyp'):
                         return
                 self._refresh_object_types()
                 types_list = [t for t in self.object_types if t and str(t).strip()]
-                current_text = self.filter_objekttyp.currentText().strip() if self.filter_objekttyp.count() else ''
-                self.filter_objekttyp.blockSignals(True)
-                self.filter_objekttyp.clear()
-                self.filter_objekttyp.addItem('')
-                self.filter_objekttyp.addItems(sorted(types_list, key=str.casefold))
-                if current_text:
-                        self.filter_objekttyp.setCurrentText(current_text)
-                else:
-                        self.filter_objekttyp.setCurrentIndex(0)
-                self.filter_objekttyp.blockSignals(False)
+                self._set_filter_values(self.filter_objekttyp, sorted(types_list, key=str.casefold))
 
         def _collect_item_dialog_values(self) -> tuple[list[str], list[str], list[str], list[str]]:
-                repo_object_types = []
-                if hasattr(self.repository, 'distinct_object_types'):
-                        repo_object_types = self.repository.distinct_object_types()
+                # Die Werte stammen aus den bereits geladenen Items statt aus weiteren Abfragen.
+                values = self._distinct_item_values()
                 self._refresh_object_types()
-                object_types = self._merge_custom_values(repo_object_types, self.object_types)
-
-                repo_manufacturers = []
-                if hasattr(self.repository, 'distinct_manufacturers'):
-                        repo_manufacturers = self.repository.distinct_manufacturers()
-                manufacturers = self._merge_custom_values(repo_manufacturers, self.custom_manufacturers)
-
-                repo_models = []
-                if hasattr(self.repository, 'distinct_models'):
-                        repo_models = self.repository.distinct_models()
-                models = self._merge_custom_values(repo_models, self.custom_models)
-
-                repo_owners = []
-                if hasattr(self.repository, 'distinct_owners'):
-                        repo_owners = self.repository.distinct_owners()
-                owners = self._merge_custom_values(repo_owners, self.custom_owners)
+                object_types = self._merge_custom_values(values['objekttyp'], self.object_types)
+                manufacturers = self._merge_custom_values(values['hersteller'], self.custom_manufacturers)
+                models = self._merge_custom_values(values['modell'], self.custom_models)
+                owners = self._merge_custom_values(values['aktueller_besitzer'], self.custom_owners)
 
                 return object_types, manufacturers, models, owners
 
@@ -751,17 +1014,10 @@ class MainWindow(QMainWindow):
 
         def _clear_date_filters(self) -> bool:
                 changed = False
-                date_edits: Iterable[Optional[QDateEdit]] = (
-                        getattr(self, 'filter_einkaufsdatum', None),
-                        getattr(self, 'filter_zuweisungsdatum', None),
-                )
-                for date_edit in date_edits:
-                        if not date_edit or not date_edit.lineEdit():
-                                continue
-                        if date_edit.lineEdit().text().strip():
-                                date_edit.blockSignals(True)
-                                date_edit.lineEdit().clear()
-                                date_edit.blockSignals(False)
+                for date_edit, line_edit in getattr(self, '_date_filter_line_edits', ()):
+                        if line_edit.text().strip():
+                                with QSignalBlocker(date_edit):
+                                        line_edit.clear()
                                 changed = True
                 return changed
 
@@ -769,17 +1025,25 @@ class MainWindow(QMainWindow):
                 if not text:
                         return None
                 # Accept display format and convert to ISO yyyy-mm-dd
+                if not _DISPLAY_DATE_RE.fullmatch(text):
+                        return None
                 try:
                         dt = datetime.strptime(text, DATE_FORMAT_DISPLAY)
                         return dt.strftime('%Y-%m-%d')
-                except Exception:
-                        try:
-                                dt = datetime.strptime(text, DATE_FORMAT_QT_DISPLAY)
-                                return dt.strftime('%Y-%m-%d')
-                        except Exception:
-                                return None
+                except ValueError:
+                        return None
+
+        @staticmethod
+        def _search_text(it: Item) -> str:
+                return ' '.join([
+                        it.objekttyp or '', it.hersteller or '', it.modell or '', it.seriennummer or '',
+                        it.einkaufsdatum or '', it.zuweisungsdatum or '', it.aktueller_besitzer or '',
+                        it.anmerkungen or ''
+                ]).lower()
 
         def apply_filters(self) -> None:
+                # Direkter Aufruf (Enter, Umschalter) ersetzt einen noch ausstehenden verzögerten Lauf.
+                self._filter_timer.stop()
                 q = self.search_field.text().strip().lower()
                 f_type = self.filter_objekttyp.currentText().strip().lower()
                 f_man = self.filter_hersteller.currentText().strip().lower()
@@ -787,6 +1051,7 @@ class MainWindow(QMainWindow):
                 f_serial = self.filter_seriennummer.currentText().strip().lower()
                 f_owner = self.filter_besitzer.currentText().strip().lower()
                 f_notes = self.filter_anmerkungen.text().strip().lower()
+                hide_inactive = self.toggle_stillgelegt_button.isChecked()
 
                 buy_text = self._date_text_or_empty(self.filter_einkaufsdatum)
                 assign_text = self._date_text_or_empty(self.filter_zuweisungsdatum)
@@ -799,7 +1064,7 @@ class MainWindow(QMainWindow):
                         return (val or '').strip().lower().find(needle) != -1
 
                 filtered: List[Item] = []
-                for it in self.items:
+                for it, search_text in zip(self.items, self._search_index):
                         if f_type and (it.objekttyp or '').strip().lower() != f_type:
                                 continue
                         if f_man and (it.hersteller or '').strip().lower() != f_man:
@@ -816,16 +1081,10 @@ class MainWindow(QMainWindow):
                                 continue
                         if assign_iso and (it.zuweisungsdatum or '') != assign_iso:
                                 continue
-                        if self.toggle_stillgelegt_button.isChecked() and getattr(it, 'stillgelegt', False):
+                        if hide_inactive and getattr(it, 'stillgelegt', False):
+                                continue
+                        if q and q not in search_text:
                                 continue
-                        if q:
-                                haystack = ' '.join([
-                                        it.objekttyp or '', it.hersteller or '', it.modell or '', it.seriennummer or '',
-                                        it.einkaufsdatum or '', it.zuweisungsdatum or '', it.aktueller_besitzer or '',
-                                        it.anmerkungen or ''
-                                ]).lower()
-                                if q not in haystack:
-                                        continue
                         filtered.append(it)
 
                 self.filtered_items = filtered
@@ -834,16 +1093,14 @@ class MainWindow(QMainWindow):
 
         def reset_filters(self) -> None:
                 self.search_field.clear()
-                for combo in (self.filter_objekttyp, self.filter_hersteller, self.filter_modell, self.filter_seriennummer, self.filter_besitzer):
+                for combo in self._combo_filter_widgets:
                         combo.setCurrentIndex(0)
                         combo.setEditText('')
-                for d in (self.filter_einkaufsdatum, self.filter_zuweisungsdatum):
-                        if d.lineEdit():
-                                d.lineEdit().setText('')
+                for _date_edit, line_edit in self._date_filter_line_edits:
+                        line_edit.setText('')
                 self.filter_anmerkungen.clear()
-                self.toggle_stillgelegt_button.blockSignals(True)
-                self.toggle_stillgelegt_button.setChecked(False)
-                self.toggle_stillgelegt_button.blockSignals(False)
+                with QSignalBlocker(self.toggle_stillgelegt_button):
+                        self.toggle_stillgelegt_button.setChecked(False)
                 self._update_stillgelegt_toggle_label(False)
                 self.filtered_items = list(self.items)
                 self.table_model.set_items(self.filtered_items)
@@ -852,10 +1109,7 @@ class MainWindow(QMainWindow):
         # ---------- Zoom/Font ----------
         def _adjust_font_size(self, delta: int) -> None:
                 self._font_size = max(7, min(24, self._font_size + delta))
-                f = QFont()
-                f.setPointSize(self._font_size)
-                self.table.setFont(f)
-                self.table.resizeRowsToContents()
+                self.settings.apply_table_font(self.table, self._font_size)
                 self.table.resizeColumnsToContents()
                 try:
                         if hasattr(self.settings, 'save_table'):
@@ -894,13 +1148,13 @@ class MainWindow(QMainWindow):
                         new_item = dialog.get_item()
                         try:
                                 if hasattr(self.repository, 'create'):
-                                        self.repository.create(new_item)
+                                        created = self.repository.create(new_item)
                                 else:
-                                        self.repository.add(new_item)
+                                        created = self.repository.add(new_item)
                         except RepositoryError as e:
                                 QMessageBox.critical(self, 'Fehler', f'Konnte Eintrag nicht speichern:\n{e}')
                                 return
-                        self._load_items()
+                        self._store_item(None, created)
                         self.reset_filters()
 
         def edit_selected_item(self) -> None:
@@ -927,12 +1181,13 @@ class MainWindow(QMainWindow):
                                 QMessageBox.critical(self, 'Fehler', 'Aktualisierung fehlgeschlagen:\nObjekt-ID fehlt.')
                                 return
                         try:
-                                self.repository.update(item_id, updated)
+                                saved = self.repository.update(item_id, updated)
                         except TypeError:
                                 # Fallback für Repositories mit älterer Signatur
-                                self.repository.update(updated)
+                                saved = self.repository.update(updated)
                         except AttributeError:
                                 # Letzter Fallback falls nur eine add/create-Methode existiert
+                                saved = None
                                 if hasattr(self.repository, 'create'):
                                         self.repository.create(updated)
                                 else:
@@ -940,7 +1195,7 @@ class MainWindow(QMainWindow):
                         except RepositoryError as e:
                                 QMessageBox.critical(self, 'Fehler', f'Aktualisierung fehlgeschlagen:\n{e}')
                                 return
-                        self._load_items()
+                        self._store_item(item, saved)
                         self.reset_filters()
 
         def delete_selected_item(self) -> None:
@@ -963,7 +1218,8 @@ class MainWindow(QMainWindow):
                 except RepositoryError as e:
                         QMessageBox.critical(self, 'Fehler', f'Löschen fehlgeschlagen:\n{e}')
                         return
-                self._load_items()
+                self._drop_item(item)
+                self._refresh_filter_combos()
                 self.apply_filters()
 
         def _deactivate_item(self, item: Item) -> None:
@@ -974,16 +1230,18 @@ class MainWindow(QMainWindow):
                 try:
                         if hasattr(self.repository, 'deactivate'):
                                 try:
-                                        self.repository.deactivate(item_id)
+                                        updated = self.repository.deactivate(item_id)
                                 except TypeError:
-                                        self.repository.deactivate(item)
+                                        updated = self.repository.deactivate(item)
                         else:
                                 setattr(item, 'stillgelegt', True)
                                 try:
-                                        self.repository.update(item_id, item)
+                                        updated = self.repository.update(item_id, item)
                                 except TypeError:
-                                        self.repository.update(item)
+                                        updated = self.repository.update(item)
                                 except AttributeError:
+                                        # Legt einen neuen Datensatz an, daher wird unten vollständig neu geladen.
+                                        updated = None
                                         if hasattr(self.repository, 'create'):
                                                 self.repository.create(item)
                                         else:
@@ -991,7 +1249,10 @@ class MainWindow(QMainWindow):
                 except RepositoryError as e:
                         QMessageBox.critical(self, 'Fehler', f'Stilllegen fehlgeschlagen:\n{e}')
                         return
-                self._load_items()
+                if isinstance(updated, Item):
+                        self._replace_item(item, updated)
+                else:
+                        self._load_items()
                 self.apply_filters()
 
         def deactivate_selected_item(self) -> None:
@@ -1006,31 +1267,40 @@ class MainWindow(QMainWindow):
                 return Path(fn) if fn else None
 
         def export_data(self, fmt: str) -> None:
-                data = self.filtered_items
-                try:
-                        if fmt == 'xlsx':
-                                path = self._pick_export_path('xlsx', 'Excel (*.xlsx)')
-                                if not path:
-                                        return
-                                export_to_xlsx(data, path)
-                        elif fmt == 'csv':
-                                path = self._pick_export_path('csv', 'CSV (*.csv)')
-                                if not path:
-                                        return
-                                export_to_csv(data, path)
-                        elif fmt == 'json':
-                                path = self._pick_export_path('json', 'JSON (*.json)')
-                                if not path:
-                                        return
-                                export_to_json(data, path)
-                        else:
-                                QMessageBox.warning(self, 'Export', f'Unbekanntes Format: {fmt}')
-                                return
-                except Exception as e:
-                        QMessageBox.critical(self, 'Export', f'Export fehlgeschlagen:\n{e}')
+                if fmt == 'xlsx':
+                        path = self._pick_export_path('xlsx', 'Excel (*.xlsx)')
+                        exporter = export_to_xlsx
+                elif fmt == 'csv':
+                        path = self._pick_export_path('csv', 'CSV (*.csv)')
+                        exporter = export_to_csv
+                elif fmt == 'json':
+                        path = self._pick_export_path('json', 'JSON (*.json)')
+                        exporter = export_to_json
+                else:
+                        QMessageBox.warning(self, 'Export', f'Unbekanntes Format: {fmt}')
+                        return
+                if not path:
                         return
+                # Kopie der Liste, da Filter während des Exports weiterlaufen können.
+                worker = ExportWorker(exporter, list(self.filtered_items), path)
+                worker.signals.finished.connect(self._handle_export_finished)
+                worker.signals.failed.connect(self._handle_export_failed)
+                self._export_worker = worker
+                self.export_button.setEnabled(False)
+                self.statusBar().showMessage('Export läuft …')
+                QThreadPool.globalInstance().start(worker)
+
+        def _handle_export_finished(self, _path: str) -> None:
+                self._export_worker = None
+                self.export_button.setEnabled(True)
                 self.statusBar().showMessage('Export erfolgreich', 4000)
 
+        def _handle_export_failed(self, message: str) -> None:
+                self._export_worker = None
+                self.export_button.setEnabled(True)
+                self.statusBar().clearMessage()
+                QMessageBox.critical(self, 'Export', f'Export fehlgeschlagen:\n{message}')
+
         def print_items(self) -> None:
                 items = list(self.filtered_items)
                 if not items:
@@ -1060,19 +1330,33 @@ class MainWindow(QMainWindow):
                         self.custom_owners = self.repository.list_custom_values(CUSTOM_CATEGORY_OWNER)
                 except Exception:
                         pass
-                self._update_owner_combo()
+                # Die Liste ist bereits sortiert; nur der neue Wert wird einsortiert.
+                owners = self.filter_besitzer.model().stringList()[1:]
+                if val in self.custom_owners and val not in owners:
+                        row = bisect.bisect_right([owner.casefold() for owner in owners], val.casefold())
+                        owners.insert(row, val)
+                        self._set_filter_values(self.filter_besitzer, owners)
 
         def _remove_owner_filter_value(self) -> None:
                 val = self.filter_besitzer.currentText().strip()
                 if not val:
                         return
+                previous = {value.strip() for value in self.custom_owners}
                 try:
                         if hasattr(self.repository, 'remove_custom_value'):
                                 self.repository.remove_custom_value(CUSTOM_CATEGORY_OWNER, val)
                         self.custom_owners = self.repository.list_custom_values(CUSTOM_CATEGORY_OWNER)
                 except Exception:
                         pass
-                self._update_owner_combo()
+                # Entfernte Werte bleiben in der Liste, solange ein Item sie noch verwendet.
+                removed = previous - {value.strip() for value in self.custom_owners}
+                if removed:
+                        in_use = {it.aktueller_besitzer.strip() for it in self.items if it.aktueller_besitzer}
+                        owners = [
+                                owner for owner in self.filter_besitzer.model().stringList()[1:]
+                                if owner not in removed or owner in in_use
+                        ]
+                        self._set_filter_values(self.filter_besitzer, owners)
 
 
 # ---------- Start/Run Helper ----------
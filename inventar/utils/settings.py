@@ -16,26 +16,39 @@ class SettingsManager:
 
         def __init__(self) -> None:
                 self.settings = QSettings(ORGANIZATION, APPLICATION)
+                # Bereits gelesene Werte, damit wiederholte Abfragen nicht erneut das Backend (z.B. Registry) lesen.
+                self._cache: dict[str, object] = {}
+
+        def _value(self, key: str, default: object = None) -> object:
+                try:
+                        value = self._cache[key]
+                except KeyError:
+                        value = self._cache[key] = self.settings.value(key)
+                return default if value is None else value
+
+        def _set_value(self, key: str, value: object) -> None:
+                self.settings.setValue(key, value)
+                self._cache[key] = value
 
         def restore_geometry(self, widget) -> None:
-                geometry = self.settings.value('main_window/geometry')
+                geometry = self._value('main_window/geometry')
                 if geometry is not None:
                         widget.restoreGeometry(geometry)
 
         def save_geometry(self, widget) -> None:
-                self.settings.setValue('main_window/geometry', widget.saveGeometry())
+                self._set_value('main_window/geometry', widget.saveGeometry())
 
         def restore_table(self, table: QTableView) -> int:
-                header_state = self.settings.value('table/state')
+                header_state = self._value('table/state')
                 if header_state is not None:
                         table.horizontalHeader().restoreState(header_state)
-                font_size = int(self.settings.value('table/font_size', 10))
+                font_size = int(self._value('table/font_size', 10))
                 self.apply_table_font(table, font_size)
                 return font_size
 
         def save_table(self, table: QTableView, font_size: int) -> None:
-                self.settings.setValue('table/state', table.horizontalHeader().saveState())
-                self.settings.setValue('table/font_size', font_size)
+                self._set_value('table/state', table.horizontalHeader().saveState())
+                self._set_value('table/font_size', font_size)
 
         @staticmethod
         def apply_table_font(table: QTableView, font_size: int) -> None:
@@ -47,6 +60,7 @@ class SettingsManager:
 
         def clear(self) -> None:
                 self.settings.clear()
+                self._cache.clear()
 
         @staticmethod
         def _normalize_object_types(values: Iterable[str]) -> list[str]:
@@ -64,7 +78,7 @@ class SettingsManager:
                 return result
 
         def load_object_types(self) -> list[str]:
-                stored = self.settings.value(OBJECT_TYPES_KEY, [])
+                stored = self._value(OBJECT_TYPES_KEY, [])
                 if isinstance(stored, str):
                         stored_values = [stored]
                 elif isinstance(stored, list):
@@ -77,7 +91,7 @@ class SettingsManager:
                 normalized = self._normalize_object_types(object_types)
                 default_lower = {value.lower() for value in DEFAULT_OBJECT_TYPES}
                 custom = [value for value in normalized if value.lower() not in default_lower]
-                self.settings.setValue(OBJECT_TYPES_KEY, custom)
+                self._set_value(OBJECT_TYPES_KEY, custom)
                 return normalized
 
         def add_object_type(self, object_type: str) -> list[str]: